@@ -6,19 +6,36 @@ Tab 3: Bootstrap Data Plate Summary
 Tab 4: Performance Calculator (full Bootstrap Method computation)
 
 Upload the resulting .xlsx to Google Sheets.
+
+The workbook is built in openpyxl's write-only mode: every tab is emitted
+top to bottom as rows of WriteOnlyCell objects, so cells stream to disk
+as they are appended instead of being held in memory until save. With lxml
+installed (a project dependency) openpyxl uses it for that streaming writer.
 """
 
+from weakref import WeakKeyDictionary
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
 import openpyxl
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.chart import ScatterChart, Reference, Series
-from openpyxl.chart.shapes import GraphicalProperties
-from openpyxl.chart.label import DataLabelList
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, numbers
-from openpyxl.utils import get_column_letter
+from openpyxl.formula.translate import Translator
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import column_index_from_string
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.writer.excel import ExcelWriter
 
 BOLD = Font(bold=True)
 HEADER_FONT = Font(bold=True, size=12)
 SECTION_FONT = Font(bold=True, size=11, color="2F5496")
 TITLE_FONT = Font(bold=True, size=14, color="2F5496")
+COURIER = Font(name="Courier New")
+STEP_FONT = Font(bold=True, size=11)
+WARNING_FONT = Font(bold=True, color="CC0000")
+LINK_FONT = Font(color="0563C1", underline="single")
+WRAP = Alignment(wrap_text=True)
 INPUT_FILL = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
 CALC_FILL = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
 RESULT_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
@@ -29,264 +46,354 @@ THIN_BORDER = Border(
     bottom=Side(style="thin"),
 )
 
+# Named styles, registered once on the workbook by register_styles(). Cells
+# pick one by name; number formats are applied per cell on top of it.
+NAMED_STYLES = [
+    NamedStyle(name="title", font=TITLE_FONT, border=DEFAULT_BORDER),
+    NamedStyle(name="section", font=SECTION_FONT, border=DEFAULT_BORDER),
+    NamedStyle(name="label", font=BOLD, border=THIN_BORDER),
+    NamedStyle(name="cell", font=DEFAULT_FONT, border=THIN_BORDER),
+    NamedStyle(name="input", font=DEFAULT_FONT, fill=INPUT_FILL, border=THIN_BORDER),
+    NamedStyle(name="calc", font=DEFAULT_FONT, fill=CALC_FILL, border=THIN_BORDER),
+    NamedStyle(name="result", font=DEFAULT_FONT, fill=RESULT_FILL, border=THIN_BORDER),
+    NamedStyle(name="code", font=COURIER, border=DEFAULT_BORDER),
+    # Instructions tab text
+    NamedStyle(name="step", font=STEP_FONT, border=DEFAULT_BORDER),
+    NamedStyle(name="prose", font=DEFAULT_FONT, border=DEFAULT_BORDER, alignment=WRAP),
+    NamedStyle(name="warning", font=WARNING_FONT, border=DEFAULT_BORDER, alignment=WRAP),
+    NamedStyle(name="link", font=LINK_FONT, border=DEFAULT_BORDER, alignment=WRAP),
+]
+
+
+def register_styles(wb):
+    for style in NAMED_STYLES:
+        wb.add_named_style(style)
+
+
+# Resolved style arrays per workbook, keyed by (style, fmt). Assigning a
+# named style or number format walks openpyxl's style descriptors, so each
+# combination is resolved once and later cells start from a copy of it.
+_STYLE_ARRAYS = WeakKeyDictionary()
+
+
+def make_cell(ws, value, style=None, fmt=None):
+    if not (style or fmt):
+        return WriteOnlyCell(ws, value=value)
+    arrays = _STYLE_ARRAYS.setdefault(ws.parent, {})
+    key = (style, fmt)
+    if key not in arrays:
+        proto = WriteOnlyCell(ws)
+        if style:
+            proto.style = style
+        if fmt:
+            proto.number_format = fmt
+        arrays[key] = proto._style
+    return Cell(ws, row=1, column=1, value=value, style_array=arrays[key])
+
+
+def set_widths(ws, first, last, width):
+    """Give columns first..last one width, written as a single <col> span."""
+    ws.column_dimensions[first] = ColumnDimension(
+        ws, index=first, width=width,
+        min=column_index_from_string(first), max=column_index_from_string(last))
+
+
+def new_tab(wb, title, widths, merges=(), index=None):
+    """Create a sheet with its layout applied; return (ws, RowWriter).
+
+    widths maps a column ("A") or a span of columns ("C:Q") to a width.
+    Widths have to be set before the first row is written in write-only
+    mode, so each tab declares its layout up front here.
+    """
+    ws = wb.create_sheet(title, index)
+    for cols, width in widths.items():
+        first, _, last = cols.partition(":")
+        set_widths(ws, first, last or first, width)
+    for cell_range in merges:
+        ws.merged_cells.add(cell_range)
+    return ws, RowWriter(ws)
 
-def style_cell(ws, row, col, value, font=None, fill=None, fmt=None, border=True):
-    cell = ws.cell(row=row, column=col, value=value)
-    if font:
-        cell.font = font
-    if fill:
-        cell.fill = fill
-    if fmt:
-        cell.number_format = fmt
-    if border:
-        cell.border = THIN_BORDER
-    return cell
+
+class RowWriter:
+    """Append rows to a write-only worksheet at fixed row numbers.
+
+    Write-only sheets can only grow downward, so rows must be appended in
+    increasing order. Rows skipped over are emitted blank. Row heights must
+    be set on ``ws.row_dimensions`` before the row is appended.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.next_row = 1
+
+    def append(self, row, cells=()):
+        if row < self.next_row:
+            raise ValueError(
+                f"{self.ws.title!r}: row {row} is above already-written "
+                f"row {self.next_row - 1}")
+        for _ in range(row - self.next_row):
+            self.ws.append([])
+        self.ws.append(list(cells))
+        self.next_row = row + 1
+
+    def field(self, row, label, value, style, fmt=None, note=None):
+        """Append a "label | value | note" row; the note is plain text."""
+        cells = [make_cell(self.ws, label, "label"),
+                 make_cell(self.ws, value, style, fmt=fmt)]
+        if note is not None:
+            cells.append(make_cell(self.ws, note))
+        self.append(row, cells)
+
+    def append_styled(self, row, values, styles):
+        """Append a row of plain values with per-column (style, fmt) pairs."""
+        self.append(row, [make_cell(self.ws, value, *style)
+                          for value, style in zip(values, styles)])
+
+
+# Blade stations x = r/R from 0.20 to 1.00 in steps of 0.05, and their
+# trapezoidal-rule weights: 1 for the first and last station, 2 between
+STATIONS = (0.20, 0.25, 0.30, 0.35, 0.40, 0.45, 0.50,
+            0.55, 0.60, 0.65, 0.70, 0.75, 0.80, 0.85,
+            0.90, 0.95, 1.00)
+WEIGHTS = (1,) + (2,) * (len(STATIONS) - 2) + (1,)
+
+# Tab 1 layout: first and last station rows, then the Results block
+STATION_ROWS = (11, 11 + len(STATIONS) - 1)  # rows 11-27
+RESULT_ROW = STATION_ROWS[1] + 2  # "Results" header, row 29
+SUM_ROW, BAF_ROW, TAF_ROW, X_ROW = range(RESULT_ROW + 1, RESULT_ROW + 5)
 
 
 def create_tab1_propeller(wb):
     """Tab 1: Propeller Blade Measurements → TAF"""
-    ws = wb.active
-    ws.title = "Prop Blade → TAF"
-
-    # Column widths
-    ws.column_dimensions["A"].width = 22
-    ws.column_dimensions["B"].width = 18
-    ws.column_dimensions["C"].width = 18
-    ws.column_dimensions["D"].width = 22
-    ws.column_dimensions["E"].width = 18
-    ws.column_dimensions["F"].width = 22
+    ws, rows = new_tab(wb, "Prop Blade → TAF", {"A": 22, "B:D": 18},
+                       merges=("A1:D1", "A2:D2"))
 
     # Title
-    ws.merge_cells("A1:F1")
-    style_cell(ws, 1, 1, "Propeller Blade Activity Factor (BAF & TAF)", font=TITLE_FONT, border=False)
+    rows.append(1, [
+        make_cell(ws, "Propeller Blade Activity Factor (BAF & TAF)",
+                  "title"),
+    ])
 
     # Instructions
-    ws.merge_cells("A2:F2")
-    style_cell(ws, 2, 1,
-               "Measure blade width at each station using calipers. "
-               "Yellow cells = your inputs. Blue cells = computed.",
-               border=False)
+    rows.append(2, [
+        make_cell(ws,
+                  "Measure blade width at each station using calipers. "
+                  "Yellow cells = your inputs. Blue cells = computed."),
+    ])
 
     # --- Prop specs ---
-    r = 4
-    style_cell(ws, r, 1, "Propeller Specs", font=SECTION_FONT, border=False)
-    r = 5
-    style_cell(ws, r, 1, "Blade Radius R (inches):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)  # user enters R here (B5)
-    r = 6
-    style_cell(ws, r, 1, "Number of Blades BB:", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)  # user enters BB here (B6)
-    r = 7
-    style_cell(ws, r, 1, "Propeller Model:", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)  # user enters model here (B7)
+    rows.append(4, [make_cell(ws, "Propeller Specs", "section")])
+    rows.field(5, "Blade Radius R (inches):", None, "input")  # user enters R here (B5)
+    rows.field(6, "Number of Blades BB:", None, "input")  # user enters BB here (B6)
+    rows.field(7, "Propeller Model:", None, "input")  # user enters model here (B7)
 
     # --- Station measurements ---
-    r = 9
-    style_cell(ws, r, 1, "Station Measurements", font=SECTION_FONT, border=False)
-    r = 10
-    style_cell(ws, r, 1, "Station (x = r/R)", font=BOLD)
-    style_cell(ws, r, 2, "r = x × R (in)", font=BOLD)
-    style_cell(ws, r, 3, "Blade Width b(x) (in)", font=BOLD)
-    style_cell(ws, r, 4, "f(x) = x³ × b(x)", font=BOLD)
-    style_cell(ws, r, 5, "Trap. Weight", font=BOLD)
-    style_cell(ws, r, 6, "Weighted f(x)", font=BOLD)
-
-    stations = [0.20, 0.25, 0.30, 0.35, 0.40, 0.45, 0.50,
-                0.55, 0.60, 0.65, 0.70, 0.75, 0.80, 0.85,
-                0.90, 0.95, 1.00]
-
-    for i, x in enumerate(stations):
-        row = 11 + i
-        # Station x
-        style_cell(ws, row, 1, x, fmt="0.00")
-        # r = x * R  (formula referencing B5)
-        style_cell(ws, row, 2, f"=A{row}*$B$5", fill=CALC_FILL, fmt="0.00")
-        # Blade width: user input
-        style_cell(ws, row, 3, None, fill=INPUT_FILL)
-        # f(x) = x³ * b(x)
-        style_cell(ws, row, 4, f"=A{row}^3*C{row}", fill=CALC_FILL, fmt="0.00")
-        # Trapezoidal weight: 1 for first and last, 2 for middle
-        weight = 1 if (i == 0 or i == len(stations) - 1) else 2
-        style_cell(ws, row, 5, weight)
-        # Weighted f(x)
-        style_cell(ws, row, 6, f"=D{row}*E{row}", fill=CALC_FILL, fmt="0.00")
+    rows.append(9, [make_cell(ws, "Station Measurements", "section")])
+    rows.append(10, [
+        make_cell(ws, "Station (x = r/R)", "label"),
+        make_cell(ws, "r = x × R (in)", "label"),
+        make_cell(ws, "Blade Width b(x) (in)", "label"),
+        make_cell(ws, "Trap. Weight", "label"),
+    ])
+
+    first, last = STATION_ROWS
+    for row, x, weight in zip(range(first, last + 1), STATIONS, WEIGHTS):
+        rows.append(row, [
+            # Station x
+            make_cell(ws, x, "cell", fmt="0.00"),
+            # r = x * R  (formula referencing B5)
+            make_cell(ws, f"=A{row}*$B$5", "calc", fmt="0.00"),
+            # Blade width: user input
+            make_cell(ws, None, "input"),
+            make_cell(ws, weight, "cell"),
+        ])
 
     # --- Results ---
-    result_row = 11 + len(stations) + 1  # row 29
-    style_cell(ws, result_row, 1, "Results", font=SECTION_FONT, border=False)
+    rows.append(RESULT_ROW, [make_cell(ws, "Results", "section")])
 
-    r = result_row + 1  # row 30
-    style_cell(ws, r, 1, "Sum of weighted f(x):", font=BOLD)
-    style_cell(ws, r, 2, f"=SUM(F11:F{11+len(stations)-1})", fill=CALC_FILL, fmt="0.00")
+    # Σ weight × f(x), with f(x) = x³ × b(x), in one formula
+    rows.field(SUM_ROW, "Sum of weighted f(x):",
+               f"=SUMPRODUCT(A{first}:A{last}^3,C{first}:C{last},D{first}:D{last})",
+               "calc", fmt="0.00",
+               note="f(x) = x³ × b(x), summed with the trapezoidal weights")
 
-    r += 1  # row 31
     # BAF = (78.125 / R) * sum_weighted_f  (Lowry Eq. 6.56)
-    style_cell(ws, r, 1, "BAF (Blade Activity Factor):", font=BOLD)
-    style_cell(ws, r, 2, f"=78.125/$B$5*B{r-1}", fill=RESULT_FILL, fmt="0.00")
-    style_cell(ws, r, 3, "Eq. 6.56: BAF = (78.125/R) × Σ weighted f(x)", border=False)
+    # 78.125/R = (10⁵/16) × (0.05/2) × 1/(2R): the BAF constant, the
+    # trapezoidal half-step for stations 0.05 apart, and b/D with D = 2R
+    rows.field(BAF_ROW, "BAF (Blade Activity Factor):", f"=78.125/$B$5*B{SUM_ROW}",
+               "result", fmt="0.00", note="Eq. 6.56: BAF = (78.125/R) × Σ weighted f(x)")
 
-    r += 1  # row 32
     # TAF = BB * BAF
-    style_cell(ws, r, 1, "TAF (Total Activity Factor):", font=BOLD)
-    style_cell(ws, r, 2, f"=$B$6*B{r-1}", fill=RESULT_FILL, fmt="0.00")
-    style_cell(ws, r, 3, "Eq. 6.55: TAF = BB × BAF", border=False)
+    rows.field(TAF_ROW, "TAF (Total Activity Factor):", f"=$B$6*B{BAF_ROW}", "result",
+               fmt="0.00", note="Eq. 6.55: TAF = BB × BAF")
 
-    r += 1  # row 33
     # X = 0.001515 * TAF - 0.0880
-    style_cell(ws, r, 1, "X (Power Adj. Factor):", font=BOLD)
-    style_cell(ws, r, 2, f"=0.001515*B{r-1}-0.0880", fill=RESULT_FILL, fmt="0.0000")
-    style_cell(ws, r, 3, "Eq. 6.57: X = 0.001515 × TAF - 0.0880", border=False)
+    rows.field(X_ROW, "X (Power Adj. Factor):", f"=0.001515*B{TAF_ROW}-0.0880", "result",
+               fmt="0.0000", note="Eq. 6.57: X = 0.001515 × TAF - 0.0880")
 
-    r += 2  # row 35
-    style_cell(ws, r, 1, "Validation:", font=SECTION_FONT, border=False)
+    r = X_ROW + 2  # row 35
+    rows.append(r, [make_cell(ws, "Validation:", "section")])
     r += 1
-    style_cell(ws, r, 1, "Typical GA BAF range: 70-140", border=False)
+    rows.append(r, [make_cell(ws, "Typical GA BAF range: 70-140")])
     r += 1
-    style_cell(ws, r, 1, "R182 example: R=41, BB=2 → BAF=97.94, TAF=195.9", border=False)
+    rows.append(r, [make_cell(ws, "R182 example: R=41, BB=2 → BAF=97.94, TAF=195.9")])
+
+
+# Standard-atmosphere exponent for σ = (1 - lapse·h/T0)^(1/0.234957),
+# folded to a literal so the σ formulas in Tabs 2 and 4 skip the division
+SIGMA_EXPONENT = f"{1 / 0.234957:.15g}"  # 4.25609792430104
+
+# First and last sheet rows of the 12 glide and 12 climb test runs in Tab 2
+GLIDE_ROWS = (32, 43)
+CLIMB_ROWS = (64, 75)
+
+
+def col_ref(ws, col, rows):
+    """Reference one column of ws over a (first, last) row range."""
+    lo, hi = rows
+    return Reference(ws, min_col=col, min_row=lo, max_row=hi)
+
+
+def row_translator(formula, first_row):
+    """Translator for a formula written for first_row, or None for no formula.
+
+    Rows only shift vertically, so the origin is anchored in column A and
+    callers translate to f"A{row}"; absolute ($) references are kept.
+    """
+    return formula and Translator(formula, origin=f"A{first_row}")
+
+
+# Formulas per Tab 2 glide column after Run #, written for the first run
+# (row 32) and translated down to each later run; "" when inputs are empty
+GLIDE_FORMULAS = tuple(row_translator(f, GLIDE_ROWS[0]) for f in (
+    None,  # Fuel gal
+    # Gross weight = empty + pax + baggage + fuel*6
+    '=IF(B32="","",$B$23+$B$24+$B$25+B32*6)',
+    None,  # KIAS
+    # KCAS = KIAS + position error
+    '=IF(D32="","",D32+$B$28)',
+    None,  # delta-t
+    # V_TAS in ft/sec = (KCAS / sqrt(sigma)) / 0.5924838
+    '=IF(D32="","",(E32/SQRT($B$19))/0.5924838)',
+    # KCAS * delta-t (for visual inspection of the curve)
+    '=IF(OR(D32="",F32=""),"",E32*F32)',
+    # V_TAS / delta-t  (y for regression: V/Δt = a·V⁴ + b)
+    '=IF(OR(D32="",F32=""),"",G32/F32)',
+    # V_TAS^4 (x for regression)
+    '=IF(OR(D32="",F32=""),"",G32^4)',
+))
+
+# Formulas per climb column after Run #, written for row 64 as above
+CLIMB_FORMULAS = tuple(row_translator(f, CLIMB_ROWS[0]) for f in (
+    None,  # Fuel gal
+    '=IF(B64="","",$B$23+$B$24+$B$25+B64*6)',
+    None,  # KIAS
+    '=IF(D64="","",D64+$B$28)',
+    None,  # delta-t
+    # ROC = ΔH_tapeline / Δt * 60
+    '=IF(F64="","",$B$18/F64*60)',
+    None,  # RPM
+    None,  # % Power from Dynon
+    # Climb angle = DEGREES(ATAN(ROC / (V_TAS * 60))), V_TAS from column K
+    '=IF(OR(D64="",F64=""),"",DEGREES(ATAN(G64/(K64*60))))',
+    # V_TAS in ft/sec = (KCAS / sqrt(sigma)) / 0.5924838, as in glide column G
+    '=IF(D64="","",(E64/SQRT($B$19))/0.5924838)',
+))
 
 
 def create_tab2_flight_tests(wb):
     """Tab 2: Glide & Climb Flight Tests → CD0, e"""
-    ws = wb.create_sheet("Flight Tests → CD0, e")
-
-    # Column widths
-    for col in ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"]:
-        ws.column_dimensions[col].width = 16
-    ws.column_dimensions["A"].width = 24
-    ws.column_dimensions["J"].width = 18
+    ws, rows = new_tab(wb, "Flight Tests → CD0, e",
+                       {"A": 24, "B:I": 16, "J": 18, "K": 16},
+                       merges=("A1:H1", "A2:H2"))
 
     # Title
-    ws.merge_cells("A1:H1")
-    style_cell(ws, 1, 1, "Glide & Climb Flight Tests", font=TITLE_FONT, border=False)
+    rows.append(1, [make_cell(ws, "Glide & Climb Flight Tests", "title")])
 
-    ws.merge_cells("A2:H2")
-    style_cell(ws, 2, 1,
-               "Yellow = inputs. Blue = computed. Green = results. "
-               "Glide tests derive CD0 and e. Climb tests are for validation.",
-               border=False)
+    rows.append(2, [
+        make_cell(ws,
+                  "Yellow = inputs. Blue = computed. Green = results. "
+                  "Glide tests derive CD0 and e. Climb tests are for validation."),
+    ])
 
     # === Aircraft constants ===
-    r = 4
-    style_cell(ws, r, 1, "Aircraft Constants", font=SECTION_FONT, border=False)
-    r = 5
-    style_cell(ws, r, 1, "Wing area S (ft²):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 6
-    style_cell(ws, r, 1, "Wing span B (ft):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 7
-    style_cell(ws, r, 1, "Aspect ratio A:", font=BOLD)
-    style_cell(ws, r, 2, "=B6^2/B5", fill=CALC_FILL, fmt="0.000")
+    rows.append(4, [make_cell(ws, "Aircraft Constants", "section")])
+    rows.field(5, "Wing area S (ft²):", None, "input")
+    rows.field(6, "Wing span B (ft):", None, "input")
+    rows.field(7, "Aspect ratio A:", "=B6^2/B5", "calc", fmt="0.000")
 
     # === Test conditions ===
-    r = 9
-    style_cell(ws, r, 1, "Test Conditions", font=SECTION_FONT, border=False)
-    r = 10
-    style_cell(ws, r, 1, "Date:", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 11
-    style_cell(ws, r, 1, "Top Pressure Alt (ft):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 12
-    style_cell(ws, r, 1, "Bottom Pressure Alt (ft):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 13
-    style_cell(ws, r, 1, "ΔH pressure (ft):", font=BOLD)
-    style_cell(ws, r, 2, "=B11-B12", fill=CALC_FILL, fmt="0.0")
-    r = 14
-    style_cell(ws, r, 1, "OAT at midpoint (°F):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 15
-    style_cell(ws, r, 1, "Mid pressure alt (ft):", font=BOLD)
-    style_cell(ws, r, 2, "=(B11+B12)/2", fill=CALC_FILL, fmt="0.0")
+    rows.append(9, [make_cell(ws, "Test Conditions", "section")])
+    rows.field(10, "Date:", None, "input")
+    rows.field(11, "Top Pressure Alt (ft):", None, "input")
+    rows.field(12, "Bottom Pressure Alt (ft):", None, "input")
+    rows.field(13, "ΔH pressure (ft):", "=B11-B12", "calc", fmt="0.0")
+    rows.field(14, "OAT at midpoint (°F):", None, "input")
+    rows.field(15, "Mid pressure alt (ft):", "=(B11+B12)/2", "calc", fmt="0.0")
 
     # Standard temp at mid altitude
-    r = 16
-    style_cell(ws, r, 1, "Std temp at mid alt (°F):", font=BOLD)
-    style_cell(ws, r, 2, "=59-0.003566*B15", fill=CALC_FILL, fmt="0.0")
+    rows.field(16, "Std temp at mid alt (°F):", "=59-0.003566*B15", "calc",
+               fmt="0.0")
 
     # Tapeline correction factor: (OAT + 459.7) / (Tstd + 459.7)
-    r = 17
-    style_cell(ws, r, 1, "Tapeline correction:", font=BOLD)
-    style_cell(ws, r, 2, "=(B14+459.7)/(B16+459.7)", fill=CALC_FILL, fmt="0.0000")
+    rows.field(17, "Tapeline correction:", "=(B14+459.7)/(B16+459.7)", "calc",
+               fmt="0.0000")
 
     # ΔH tapeline
-    r = 18
-    style_cell(ws, r, 1, "ΔH tapeline (ft):", font=BOLD)
-    style_cell(ws, r, 2, "=B13*B17", fill=CALC_FILL, fmt="0.0")
+    rows.field(18, "ΔH tapeline (ft):", "=B13*B17", "calc", fmt="0.0")
 
     # Sigma at mid altitude
-    r = 19
-    style_cell(ws, r, 1, "σ (density ratio):", font=BOLD)
-    style_cell(ws, r, 2, "=(1-0.003566*B15/518.7)^(1/0.234957)", fill=CALC_FILL, fmt="0.0000")
+    rows.field(19, "σ (density ratio):",
+               f"=(1-0.003566*B15/518.7)^{SIGMA_EXPONENT}", "calc", fmt="0.0000")
 
     # Rho
-    r = 20
-    style_cell(ws, r, 1, "ρ (slug/ft³):", font=BOLD)
-    style_cell(ws, r, 2, "=0.002377*B19", fill=CALC_FILL, fmt="0.000000")
+    rows.field(20, "ρ (slug/ft³):", "=0.002377*B19", "calc", fmt="0.000000")
 
     # Empty weight, fuel, occupants for weight computation
-    r = 22
-    style_cell(ws, r, 1, "Weight Computation", font=SECTION_FONT, border=False)
-    r = 23
-    style_cell(ws, r, 1, "Empty weight (lbs):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 24
-    style_cell(ws, r, 1, "Pilot + pax (lbs):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
-    r = 25
-    style_cell(ws, r, 1, "Baggage (lbs):", font=BOLD)
-    style_cell(ws, r, 2, None, fill=INPUT_FILL)
+    rows.append(22, [make_cell(ws, "Weight Computation", "section")])
+    rows.field(23, "Empty weight (lbs):", None, "input")
+    rows.field(24, "Pilot + pax (lbs):", None, "input")
+    rows.field(25, "Baggage (lbs):", None, "input")
 
     # === IAS to CAS correction ===
-    r = 27
-    style_cell(ws, r, 1, "IAS → CAS Correction", font=SECTION_FONT, border=False)
-    r = 28
-    style_cell(ws, r, 1, "Position error (kt):", font=BOLD)
-    style_cell(ws, r, 2, 0, fill=INPUT_FILL)
-    style_cell(ws, r, 3, "(Enter correction to add; 0 if KIAS ≈ KCAS)", border=False)
+    rows.append(27, [make_cell(ws, "IAS → CAS Correction", "section")])
+    rows.field(28, "Position error (kt):", 0, "input",
+               note="(Enter correction to add; 0 if KIAS ≈ KCAS)")
 
     # === GLIDE TEST DATA ===
-    r = 30
-    style_cell(ws, r, 1, "GLIDE TEST RUNS", font=SECTION_FONT, border=False)
-    style_cell(ws, r, 5, "Prop at low RPM, power idle, trimmed & stabilized", border=False)
+    rows.append(30, [
+        make_cell(ws, "GLIDE TEST RUNS", "section"),
+        None, None, None,
+        make_cell(ws, "Prop at low RPM, power idle, trimmed & stabilized"),
+    ])
 
-    r = 31
     # Columns A-H: core data; I-J: regression basis functions
     headers = ["Run #", "Fuel (gal)", "Gross Wt (lbs)", "KIAS",
                "KCAS", "Δt (sec)", "V_TAS (fps)", "KCAS × Δt",
                "V/Δt", "V⁴"]
-    for i, h in enumerate(headers):
-        style_cell(ws, r, i + 1, h, font=BOLD)
+    rows.append(31, [make_cell(ws, h, "label") for h in headers])
+
+    # Named style and number format per glide column
+    glide_styles = [
+        ("cell", None),     # Run #
+        ("input", None),    # Fuel gal
+        ("calc", "0.0"),    # Gross Wt
+        ("input", None),    # KIAS
+        ("calc", "0.0"),    # KCAS
+        ("input", None),    # delta-t
+        ("calc", "0.00"),   # V_TAS
+        ("calc", "0.0"),    # KCAS × Δt
+        ("calc", "0.000"),  # V/Δt
+        ("calc", "0.0"),    # V⁴
+    ]
 
-    # 12 glide test rows (formulas return "" when input cells are empty)
+    # 12 glide test rows
     for run in range(1, 13):
         row = 31 + run
-        style_cell(ws, row, 1, run)  # Run #
-        style_cell(ws, row, 2, None, fill=INPUT_FILL)  # Fuel gal
-        # Gross weight = empty + pax + baggage + fuel*6
-        style_cell(ws, row, 3, f'=IF(B{row}="","",$B$23+$B$24+$B$25+B{row}*6)',
-                   fill=CALC_FILL, fmt="0.0")
-        style_cell(ws, row, 4, None, fill=INPUT_FILL)  # KIAS
-        # KCAS = KIAS + position error
-        style_cell(ws, row, 5, f'=IF(D{row}="","",D{row}+$B$28)', fill=CALC_FILL, fmt="0.0")
-        style_cell(ws, row, 6, None, fill=INPUT_FILL)  # delta-t
-        # V_TAS in ft/sec = (KCAS / sqrt(sigma)) / 0.5924838
-        style_cell(ws, row, 7,
-                   f'=IF(D{row}="","",IFERROR((E{row}/SQRT($B$19))/0.5924838,""))',
-                   fill=CALC_FILL, fmt="0.00")
-        # KCAS * delta-t (for visual inspection of the curve)
-        style_cell(ws, row, 8,
-                   f'=IF(OR(D{row}="",F{row}=""),"",E{row}*F{row})',
-                   fill=CALC_FILL, fmt="0.0")
-        # V_TAS / delta-t  (y for regression: V/Δt = a·V⁴ + b)
-        style_cell(ws, row, 9,
-                   f'=IF(OR(D{row}="",F{row}=""),"",G{row}/F{row})',
-                   fill=CALC_FILL, fmt="0.000")
-        # V_TAS^4 (x for regression)
-        style_cell(ws, row, 10,
-                   f'=IF(OR(D{row}="",F{row}=""),"",G{row}^4)',
-                   fill=CALC_FILL, fmt="0.0")
+        rows.append_styled(
+            row, [run] + [t and t.translate_formula(f"A{row}")
+                          for t in GLIDE_FORMULAS],
+            glide_styles)
 
     # === Curve Fit: V/Δt = a·V⁴ + b ===
     # From the drag polar: D = CD0·q·S + W²/(q·S·π·A·e)
@@ -298,147 +405,129 @@ def create_tab2_flight_tests(wb):
     #   CD0 = a · 2·W·ΔH / (ρ·S)
     #   e   = 2·W / (b · ρ·S·π·A·ΔH)
 
-    r = 45
-    style_cell(ws, r, 1, "Curve Fit: V/Δt = a·V⁴ + b", font=SECTION_FONT, border=False)
+    rows.append(45, [make_cell(ws, "Curve Fit: V/Δt = a·V⁴ + b", "section")])
 
-    r = 46
-    style_cell(ws, r, 1, "Avg gross weight W (lbs):", font=BOLD)
-    style_cell(ws, r, 2, "=AVERAGE(C32:C43)", fill=CALC_FILL, fmt="0.0")
-    style_cell(ws, r, 3, "(used for CD0/e extraction)", border=False)
+    rows.field(46, "Avg gross weight W (lbs):", "=AVERAGE(C32:C43)", "calc",
+               fmt="0.0", note="(used for CD0/e extraction)")
 
-    r = 47
-    style_cell(ws, r, 1, "a (slope):", font=BOLD)
-    style_cell(ws, r, 2, "=SLOPE(I32:I43,J32:J43)", fill=CALC_FILL, fmt="0.000000000")
-    style_cell(ws, r, 3, "a = CD0·ρ·S / (2·W·ΔH)", border=False)
+    rows.field(47, "a (slope):", "=SLOPE(I32:I43,J32:J43)", "calc",
+               fmt="0.000000000", note="a = CD0·ρ·S / (2·W·ΔH)")
 
-    r = 48
-    style_cell(ws, r, 1, "b (intercept):", font=BOLD)
-    style_cell(ws, r, 2, "=INTERCEPT(I32:I43,J32:J43)", fill=CALC_FILL, fmt="0.000000")
-    style_cell(ws, r, 3, "b = 2·W / (ρ·S·π·A·e·ΔH)", border=False)
+    rows.field(48, "b (intercept):", "=INTERCEPT(I32:I43,J32:J43)", "calc",
+               fmt="0.000000", note="b = 2·W / (ρ·S·π·A·e·ΔH)")
 
     # V_bg from curve fit
-    r = 49
-    style_cell(ws, r, 1, "V_bg TAS (fps):", font=BOLD)
-    style_cell(ws, r, 2, "=(B48/B47)^0.25", fill=CALC_FILL, fmt="0.00")
-    style_cell(ws, r, 3, "V_bg = (b/a)^(1/4)", border=False)
+    rows.field(49, "V_bg TAS (fps):", "=(B48/B47)^0.25", "calc",
+               fmt="0.00", note="V_bg = (b/a)^(1/4)")
 
-    r = 50
-    style_cell(ws, r, 1, "Vbg (KCAS):", font=BOLD)
-    style_cell(ws, r, 2, "=B49*SQRT($B$19)*0.5924838", fill=RESULT_FILL, fmt="0.0")
-    style_cell(ws, r, 3, "V_bg_TAS × √σ × 0.5924838", border=False)
+    rows.field(50, "Vbg (KCAS):", "=B49*SQRT($B$19)*0.5924838", "result",
+               fmt="0.0", note="V_bg_TAS × √σ × 0.5924838")
 
     # === CD0 and e from curve fit ===
-    r = 52
-    style_cell(ws, r, 1, "CD0 and e (from curve fit)", font=SECTION_FONT, border=False)
+    rows.append(52, [make_cell(ws, "CD0 and e (from curve fit)", "section")])
 
     # CD0 = a × 2·W·ΔH / (ρ·S)
-    r = 53
-    style_cell(ws, r, 1, "CD0:", font=BOLD)
-    style_cell(ws, r, 2, "=B47*2*B46*$B$18/($B$20*$B$5)", fill=RESULT_FILL, fmt="0.00000")
-    style_cell(ws, r, 3, "a × 2·W·ΔH / (ρ·S)", border=False)
+    rows.field(53, "CD0:", "=B47*2*B46*$B$18/($B$20*$B$5)", "result",
+               fmt="0.00000", note="a × 2·W·ΔH / (ρ·S)")
 
     # e = 2·W / (b × ρ·S·π·A·ΔH)
-    r = 54
-    style_cell(ws, r, 1, "e (efficiency factor):", font=BOLD)
-    style_cell(ws, r, 2, "=2*B46/(B48*$B$20*$B$5*PI()*$B$7*$B$18)",
-               fill=RESULT_FILL, fmt="0.000")
-    style_cell(ws, r, 3, "2·W / (b·ρ·S·π·A·ΔH)", border=False)
+    rows.field(54, "e (efficiency factor):",
+               "=2*B46/(B48*$B$20*$B$5*PI()*$B$7*$B$18)", "result",
+               fmt="0.000", note="2·W / (b·ρ·S·π·A·ΔH)")
 
     # Max L/D for reference
-    r = 55
-    style_cell(ws, r, 1, "Max L/D:", font=BOLD)
-    style_cell(ws, r, 2, "=1/(2*SQRT(B53/(PI()*$B$7*B54)))", fill=CALC_FILL, fmt="0.0")
-    style_cell(ws, r, 3, "1 / (2·√(CD0/(π·A·e)))", border=False)
+    rows.field(55, "Max L/D:", "=1/(2*SQRT(B53/(PI()*$B$7*B54)))", "calc",
+               fmt="0.0", note="1 / (2·√(CD0/(π·A·e)))")
 
     # R² for fit quality
-    r = 56
-    style_cell(ws, r, 1, "R² (fit quality):", font=BOLD)
-    style_cell(ws, r, 2, "=RSQ(I32:I43,J32:J43)", fill=CALC_FILL, fmt="0.0000")
-    style_cell(ws, r, 3, "Should be > 0.99 for good data", border=False)
+    rows.field(56, "R² (fit quality):", "=RSQ(I32:I43,J32:J43)", "calc",
+               fmt="0.0000", note="Should be > 0.99 for good data")
 
     # KCAS×Δt at Vbg (for sanity check vs raw data)
-    r = 57
-    style_cell(ws, r, 1, "Max KCAS×Δt (raw data):", font=BOLD)
-    style_cell(ws, r, 2, "=MAX(H32:H43)", fill=CALC_FILL, fmt="0.0")
-    style_cell(ws, r, 3, "Sanity check: Vbg should be near the max row", border=False)
+    rows.field(57, "Max KCAS×Δt (raw data):", "=MAX(H32:H43)", "calc",
+               fmt="0.0", note="Sanity check: Vbg should be near the max row")
 
     # === CLIMB TEST DATA (validation) ===
-    r = 62
-    style_cell(ws, r, 1, "CLIMB TEST RUNS (Validation)", font=SECTION_FONT, border=False)
-    style_cell(ws, r, 5, "Full power at 2500 RPM, trimmed & stabilized", border=False)
-
-    r = 63
+    rows.append(62, [
+        make_cell(ws, "CLIMB TEST RUNS (Validation)", "section"),
+        None, None, None,
+        make_cell(ws, "Full power at 2500 RPM, trimmed & stabilized"),
+    ])
+
+    # Column J holds the climb angle, used below to find Vx; K holds the
+    # V_TAS it is computed from
     climb_headers = ["Run #", "Fuel (gal)", "Gross Wt (lbs)", "KIAS",
-                     "KCAS", "Δt (sec)", "ROC (fpm)", "RPM", "% Power"]
-    for i, h in enumerate(climb_headers):
-        style_cell(ws, r, i + 1, h, font=BOLD)
+                     "KCAS", "Δt (sec)", "ROC (fpm)", "RPM", "% Power",
+                     "Climb Angle (°)", "V_TAS (fps)"]
+    rows.append(63, [make_cell(ws, h, "label") for h in climb_headers])
+
+    # Named style and number format per climb column
+    climb_styles = [
+        ("cell", None),     # Run #
+        ("input", None),    # Fuel gal
+        ("calc", "0.0"),    # Gross Wt
+        ("input", None),    # KIAS
+        ("calc", "0.0"),    # KCAS
+        ("input", None),    # delta-t
+        ("calc", "0.0"),    # ROC
+        ("input", None),    # RPM
+        ("input", None),    # % Power
+        ("calc", "0.00"),   # Climb angle
+        ("calc", "0.00"),   # V_TAS
+    ]
 
-    # 12 climb test rows (formulas return "" when input cells are empty)
+    # 12 climb test rows
     for run in range(1, 13):
         row = 63 + run
-        style_cell(ws, row, 1, run)
-        style_cell(ws, row, 2, None, fill=INPUT_FILL)  # Fuel gal
-        style_cell(ws, row, 3, f'=IF(B{row}="","",$B$23+$B$24+$B$25+B{row}*6)',
-                   fill=CALC_FILL, fmt="0.0")
-        style_cell(ws, row, 4, None, fill=INPUT_FILL)  # KIAS
-        style_cell(ws, row, 5, f'=IF(D{row}="","",D{row}+$B$28)', fill=CALC_FILL, fmt="0.0")
-        style_cell(ws, row, 6, None, fill=INPUT_FILL)  # delta-t
-        # ROC = ΔH_tapeline / Δt * 60
-        style_cell(ws, row, 7, f'=IF(F{row}="","",IFERROR($B$18/F{row}*60,""))',
-                   fill=CALC_FILL, fmt="0.0")
-        style_cell(ws, row, 8, None, fill=INPUT_FILL)  # RPM
-        style_cell(ws, row, 9, None, fill=INPUT_FILL)  # % Power from Dynon
+        rows.append_styled(
+            row, [run] + [t and t.translate_formula(f"A{row}")
+                          for t in CLIMB_FORMULAS],
+            climb_styles)
 
     # === Climb test analysis: derive Vx from measured data ===
-    r = 77
-    style_cell(ws, r, 1, "Climb Test Analysis", font=SECTION_FONT, border=False)
-    r = 78
-    style_cell(ws, r, 1, "Best ROC speed (Vy):", font=BOLD)
+    rows.append(77, [make_cell(ws, "Climb Test Analysis", "section")])
     # Find KCAS of the row with max ROC. Use INDEX/MATCH.
-    style_cell(ws, r, 2,
-               "=IFERROR(INDEX(E64:E75,MATCH(MAX(G64:G75),G64:G75,0)),\"\")",
-               fill=RESULT_FILL, fmt="0.0")
-    style_cell(ws, r, 3, "KCAS", font=BOLD)
-    style_cell(ws, r, 4, "KCAS at max ROC", border=False)
-
-    r = 79
-    style_cell(ws, r, 1, "Max ROC:", font=BOLD)
-    style_cell(ws, r, 2, "=IFERROR(MAX(G64:G75),\"\")", fill=RESULT_FILL, fmt="0.0")
-    style_cell(ws, r, 3, "ft/min", font=BOLD)
-
-    r = 80
-    style_cell(ws, r, 1, "Best climb angle speed (Vx):", font=BOLD)
+    rows.append(78, [
+        make_cell(ws, "Best ROC speed (Vy):", "label"),
+        make_cell(ws,
+                  "=IFERROR(INDEX(E64:E75,MATCH(MAX(G64:G75),G64:G75,0)),\"\")",
+                  "result", fmt="0.0"),
+        make_cell(ws, "KCAS", "label"),
+        make_cell(ws, "KCAS at max ROC"),
+    ])
+
+    rows.append(79, [
+        make_cell(ws, "Max ROC:", "label"),
+        make_cell(ws, "=IFERROR(MAX(G64:G75),\"\")", "result", fmt="0.0"),
+        make_cell(ws, "ft/min", "label"),
+    ])
+
     # Climb angle ≈ arcsin(ROC / (V_TAS × 60)) in degrees
     # But for finding the max, we can compute sin(γ) = ROC/(V*60) for each row.
     # V_TAS(fps) = (KCAS / √σ) / 0.5924838
     # Climb angle = DEGREES(ASIN(ROC / (V_TAS * 60)))
-    # We need a helper column. Let's put climb angle in column J.
-    style_cell(ws, r, 2,
-               "=IFERROR(INDEX(E64:E75,MATCH(MAX(J64:J75),J64:J75,0)),\"\")",
-               fill=RESULT_FILL, fmt="0.0")
-    style_cell(ws, r, 3, "KCAS", font=BOLD)
-    style_cell(ws, r, 4, "KCAS at max climb angle", border=False)
-
-    r = 81
-    style_cell(ws, r, 1, "Max climb angle:", font=BOLD)
-    style_cell(ws, r, 2, "=IFERROR(MAX(J64:J75),\"\")", fill=RESULT_FILL, fmt="0.00")
-    style_cell(ws, r, 3, "degrees", font=BOLD)
-
-    # Add climb angle column header and formulas
-    style_cell(ws, 63, 10, "Climb Angle (°)", font=BOLD)
-    for run in range(1, 13):
-        row = 63 + run
-        # Climb angle = DEGREES(ATAN(ROC / (V_TAS * 60)))
-        # V_TAS = (KCAS / sqrt(sigma)) / 0.5924838
-        style_cell(ws, row, 10,
-                   f'=IF(OR(D{row}="",F{row}=""),"",IFERROR(DEGREES(ATAN(G{row}/(((E{row}/SQRT($B$19))/0.5924838)*60))),""))',
-                   fill=CALC_FILL, fmt="0.00")
-
-    r = 83
-    style_cell(ws, r, 1, "Compare these against bootstrap predictions:", border=False)
-    style_cell(ws, r, 4,
-               "Run the Clojure calculator at the same W, h, RPM, % power",
-               border=False)
+    # This needs a helper column, so the climb angle lives in column J.
+    rows.append(80, [
+        make_cell(ws, "Best climb angle speed (Vx):", "label"),
+        make_cell(ws,
+                  "=IFERROR(INDEX(E64:E75,MATCH(MAX(J64:J75),J64:J75,0)),\"\")",
+                  "result", fmt="0.0"),
+        make_cell(ws, "KCAS", "label"),
+        make_cell(ws, "KCAS at max climb angle"),
+    ])
+
+    rows.append(81, [
+        make_cell(ws, "Max climb angle:", "label"),
+        make_cell(ws, "=IFERROR(MAX(J64:J75),\"\")", "result", fmt="0.00"),
+        make_cell(ws, "degrees", "label"),
+    ])
+
+    rows.append(83, [
+        make_cell(ws, "Compare these against bootstrap predictions:"),
+        None, None,
+        make_cell(ws,
+                  "Run the Clojure calculator at the same W, h, RPM, % power"),
+    ])
 
     # === CHARTS ===
     # Chart 1: V/Δt vs V⁴ (the regression basis — shows linearity)
@@ -449,8 +538,8 @@ def create_tab2_flight_tests(wb):
     chart1.width = 18
     chart1.height = 12
 
-    x_data = Reference(ws, min_col=10, min_row=32, max_row=43)  # V⁴ (col J)
-    y_data = Reference(ws, min_col=9, min_row=32, max_row=43)   # V/Δt (col I)
+    x_data = col_ref(ws, 10, GLIDE_ROWS)  # V⁴ (col J)
+    y_data = col_ref(ws, 9, GLIDE_ROWS)   # V/Δt (col I)
     series1 = Series(y_data, x_data, title="Glide data")
     series1.graphicalProperties.line.noFill = True  # scatter, no line between points
     chart1.series.append(series1)
@@ -469,8 +558,8 @@ def create_tab2_flight_tests(wb):
     chart2.width = 18
     chart2.height = 12
 
-    x_data2 = Reference(ws, min_col=5, min_row=32, max_row=43)  # KCAS (col E)
-    y_data2 = Reference(ws, min_col=8, min_row=32, max_row=43)  # KCAS×Δt (col H)
+    x_data2 = col_ref(ws, 5, GLIDE_ROWS)  # KCAS (col E)
+    y_data2 = col_ref(ws, 8, GLIDE_ROWS)  # KCAS×Δt (col H)
     series2 = Series(y_data2, x_data2, title="Glide data")
     chart2.series.append(series2)
     ws.add_chart(chart2, "A108")
@@ -483,116 +572,169 @@ def create_tab2_flight_tests(wb):
     chart3.width = 18
     chart3.height = 12
 
-    x_data3 = Reference(ws, min_col=5, min_row=64, max_row=75)  # KCAS (col E)
-    y_data3 = Reference(ws, min_col=7, min_row=64, max_row=75)  # ROC (col G)
+    x_data3 = col_ref(ws, 5, CLIMB_ROWS)  # KCAS (col E)
+    y_data3 = col_ref(ws, 7, CLIMB_ROWS)  # ROC (col G)
     series3 = Series(y_data3, x_data3, title="Climb data")
     chart3.series.append(series3)
     ws.add_chart(chart3, "A130")
 
 
+# Data Plate rows (B5:B16): (parameter, value, units, source, style, fmt).
+# Inputs are pre-filled with the R182 example; CD0, e and TAF are pulled
+# from the Flight Tests and Prop Blade tabs.
+DATA_PLATE_PARAMS = (
+    ("S (wing area)",         174.0,   "ft²",       "POH / plans",         "input",  "0.00"),
+    ("B (wing span)",         36.0,    "ft",        "POH / plans",         "input",  "0.00"),
+    ("P0 (rated power)",      235.0,   "hp",        "POH",                 "input",  "0.00"),
+    ("N0 (rated RPM)",        2400,    "RPM",       "POH",                 "input",  "0.00"),
+    ("d (prop diameter)",     6.83,    "ft",        "Measurement",         "input",  "0.00"),
+    ("CD0",                   "='Flight Tests → CD0, e'!B53", "",  "Tab 2 (curve fit)",  "result", "0.00000"),
+    ("e",                     "='Flight Tests → CD0, e'!B54", "",  "Tab 2 (curve fit)",  "result", "0.00000"),
+    ("TAF",                   f"='Prop Blade → TAF'!B{TAF_ROW}", "",  "Tab 1 (prop measurement)", "result", "0.00"),
+    ("Z (fuselage dia / prop dia)", 0.688, "",      "Measurement: fuse_dia / prop_dia", "input", "0.00"),
+    ("Tractor? (1=yes, 0=no)", 1,      "",          "Configuration",       "input",  "0.00"),
+    ("BB (num blades)",       2,       "",           "Observation",         "input",  "0.00"),
+    ("C (power dropoff)",     0.12,    "",           "Typical normally-aspirated: 0.12", "input", "0.00"),
+)
+
+# Each row of the Clojure map, as one formula per line so the column
+# copies out as plain text: (key, value expression, trailing comment)
+CLJ_LINES = (
+    ('{:S',        'TEXT(B5,"0.0")',    '  ;; wing area, ft²'),
+    (' :B',        'TEXT(B6,"0.0")',    '  ;; wing span, ft'),
+    (' :P0',       'TEXT(B7,"0.0")',    '  ;; rated MSL power, hp'),
+    (' :N0',       'TEXT(B8,"0")',      '  ;; rated RPM'),
+    (' :d',        'TEXT(B9,"0.000")',  '  ;; prop diameter, ft'),
+    (' :CD0',      'TEXT(B10,"0.00000")', '  ;; parasite drag coefficient'),
+    (' :e',        'TEXT(B11,"0.000")', '  ;; airplane efficiency factor'),
+    (' :TAF',      'TEXT(B12,"0.0")',   '  ;; total activity factor'),
+    (' :Z',        'TEXT(B13,"0.000")', '  ;; fuselage dia / prop dia'),
+    (' :tractor?', 'IF(B14=1,"true","false")', ''),
+    (' :BB',       'TEXT(B15,"0")',     '  ;; number of blades'),
+    (' :C',        'TEXT(B16,"0.00")',  '}  ;; altitude power dropoff'),
+)
+
+
 def create_tab3_data_plate(wb):
     """Tab 3: Bootstrap Data Plate Summary"""
-    ws = wb.create_sheet("Data Plate")
-
-    ws.column_dimensions["A"].width = 30
-    ws.column_dimensions["B"].width = 18
-    ws.column_dimensions["C"].width = 14
-    ws.column_dimensions["D"].width = 40
+    ws, rows = new_tab(wb, "Data Plate", {"A": 30, "B": 18, "C": 14, "D": 40},
+                       merges=("A1:D1", "A2:D2"))
 
     # Title
-    ws.merge_cells("A1:D1")
-    style_cell(ws, 1, 1, "Bootstrap Data Plate", font=TITLE_FONT, border=False)
+    rows.append(1, [make_cell(ws, "Bootstrap Data Plate", "title")])
 
-    ws.merge_cells("A2:D2")
-    style_cell(ws, 2, 1,
-               "Yellow = manual inputs. Green = computed from other tabs. "
-               "Copy the Clojure map below into your code.",
-               border=False)
+    rows.append(2, [
+        make_cell(ws,
+                  "Yellow = manual inputs. Green = computed from other tabs. "
+                  "Copy the Clojure map below into your code."),
+    ])
 
     # Header
-    r = 4
-    style_cell(ws, r, 1, "Parameter", font=BOLD)
-    style_cell(ws, r, 2, "Value", font=BOLD)
-    style_cell(ws, r, 3, "Units", font=BOLD)
-    style_cell(ws, r, 4, "Source", font=BOLD)
+    rows.append(4, [
+        make_cell(ws, "Parameter", "label"),
+        make_cell(ws, "Value", "label"),
+        make_cell(ws, "Units", "label"),
+        make_cell(ws, "Source", "label"),
+    ])
 
     # Data rows
-    params = [
-        ("S (wing area)",         174.0,   "ft²",       "POH / plans",         INPUT_FILL),
-        ("B (wing span)",         36.0,    "ft",        "POH / plans",         INPUT_FILL),
-        ("P0 (rated power)",      235.0,   "hp",        "POH",                 INPUT_FILL),
-        ("N0 (rated RPM)",        2400,    "RPM",       "POH",                 INPUT_FILL),
-        ("d (prop diameter)",     6.83,    "ft",        "Measurement",         INPUT_FILL),
-        ("CD0",                   "='Flight Tests → CD0, e'!B53", "",  "Tab 2 (curve fit)",  RESULT_FILL),
-        ("e",                     "='Flight Tests → CD0, e'!B54", "",  "Tab 2 (curve fit)",  RESULT_FILL),
-        ("TAF",                   "='Prop Blade → TAF'!B32",      "",  "Tab 1 (prop measurement)", RESULT_FILL),
-        ("Z (fuselage dia / prop dia)", 0.688, "",      "Measurement: fuse_dia / prop_dia", INPUT_FILL),
-        ("Tractor? (1=yes, 0=no)", 1,      "",          "Configuration",       INPUT_FILL),
-        ("BB (num blades)",       2,       "",           "Observation",         INPUT_FILL),
-        ("C (power dropoff)",     0.12,    "",           "Typical normally-aspirated: 0.12", INPUT_FILL),
-    ]
-
-    for i, (name, val, units, source, fill) in enumerate(params):
-        row = 5 + i
-        style_cell(ws, row, 1, name, font=BOLD)
-        style_cell(ws, row, 2, val, fill=fill, fmt="0.00000" if name in ("CD0", "e") else "0.00")
-        style_cell(ws, row, 3, units)
-        style_cell(ws, row, 4, source)
+    for i, (name, val, units, source, style, fmt) in enumerate(DATA_PLATE_PARAMS):
+        rows.append_styled(5 + i, (name, val, units, source),
+                           (("label", None), (style, fmt),
+                            ("cell", None), ("cell", None)))
 
     # Derived: X from TAF
-    r = 5 + len(params)
-    style_cell(ws, r, 1, "X (power adj. factor)", font=BOLD)
-    style_cell(ws, r, 2, "=0.001515*B12-0.0880", fill=RESULT_FILL, fmt="0.0000")
-    style_cell(ws, r, 3, "")
-    style_cell(ws, r, 4, "Eq 6.57: X = 0.001515 × TAF - 0.0880")
+    r = 5 + len(DATA_PLATE_PARAMS)
+    rows.append(r, [
+        make_cell(ws, "X (power adj. factor)", "label"),
+        make_cell(ws, "=0.001515*B12-0.0880", "result", fmt="0.0000"),
+        make_cell(ws, "", "cell"),
+        make_cell(ws, "Eq 6.57: X = 0.001515 × TAF - 0.0880", "cell"),
+    ])
 
     # Aspect ratio
     r += 1
-    style_cell(ws, r, 1, "A (aspect ratio)", font=BOLD)
-    style_cell(ws, r, 2, "=B6^2/B5", fill=CALC_FILL, fmt="0.000")
-    style_cell(ws, r, 3, "")
-    style_cell(ws, r, 4, "B² / S")
+    rows.append(r, [
+        make_cell(ws, "A (aspect ratio)", "label"),
+        make_cell(ws, "=B6^2/B5", "calc", fmt="0.000"),
+        make_cell(ws, "", "cell"),
+        make_cell(ws, "B² / S", "cell"),
+    ])
 
     # === Clojure data plate literal ===
     r += 2
-    style_cell(ws, r, 1, "Clojure Data Plate (copy-paste):", font=SECTION_FONT, border=False)
+    rows.append(r, [make_cell(ws, "Clojure Data Plate (copy-paste):", "section")])
     r += 1
-    # Each row of the Clojure map
-    clj_lines = [
-        ('{:S',        '=TEXT(B5,"0.0")',    '  ;; wing area, ft²'),
-        (' :B',        '=TEXT(B6,"0.0")',    '  ;; wing span, ft'),
-        (' :P0',       '=TEXT(B7,"0.0")',    '  ;; rated MSL power, hp'),
-        (' :N0',       '=TEXT(B8,"0")',      '  ;; rated RPM'),
-        (' :d',        '=TEXT(B9,"0.000")',  '  ;; prop diameter, ft'),
-        (' :CD0',      '=TEXT(B10,"0.00000")', '  ;; parasite drag coefficient'),
-        (' :e',        '=TEXT(B11,"0.000")', '  ;; airplane efficiency factor'),
-        (' :TAF',      '=TEXT(B12,"0.0")',   '  ;; total activity factor'),
-        (' :Z',        '=TEXT(B13,"0.000")', '  ;; fuselage dia / prop dia'),
-        (' :tractor?', '=IF(B14=1,"true","false")', ''),
-        (' :BB',       '=TEXT(B15,"0")',     '  ;; number of blades'),
-        (' :C',        '=TEXT(B16,"0.00")',  '}  ;; altitude power dropoff'),
-    ]
-    for key, formula, comment in clj_lines:
-        ws.cell(row=r, column=1, value=key).font = Font(name="Courier New")
-        ws.cell(row=r, column=2, value=formula).font = Font(name="Courier New")
-        ws.cell(row=r, column=3, value=comment).font = Font(name="Courier New")
+    for key, value, comment in CLJ_LINES:
+        formula = f'="{key} "&{value}'
+        if comment:
+            formula += f'&"{comment}"'
+        rows.append(r, [make_cell(ws, formula, "code")])
         r += 1
 
 
+# Tab 4 GAGPC propeller-efficiency data (Boeing/Uddenberg): the CPX
+# breakpoints, one per coefficient column C-J.
+CPX_BREAKPOINTS = (0.15, 0.25, 0.40, 0.60, 0.80, 1.00, 1.20, 1.40)
+
+# GAGPC coefficients: 8 columns (one per CPX) x 7 rows (c0-c6).
+# GAGPC[col_idx] = (c0, c1, ..., c6) for CPX_BREAKPOINTS[col_idx].
+GAGPC = (
+    (-0.027280541925,  1.157818942224, -0.548923123013,  0.038551650269,  0.064580555280, -0.026301243311,  0.003017419881),
+    (-0.038502996895,  1.046135815788, -0.485313329667,  0.130100232509, -0.027326610124,  0.003139013961, -0.000131566345),
+    (-0.026741905000,  0.717582413500, -0.084673350000, -0.074451680000,  0.026437051000, -0.003537565000,  0.000177733000),
+    ( 0.038100252152,  0.199522455590,  0.458898025445, -0.318992736679,  0.081357821405, -0.009083801712,  0.000350613126),
+    ( 0.251897476000, -0.561665840000,  1.139055130000, -0.602193330000,  0.144341736000, -0.016194730000,  0.000664038000),
+    ( 0.140144145675,  0.071636129794, -0.057356417627,  0.276378945894, -0.159843307011,  0.034239846258, -0.002573002786),
+    (-0.705604050000,  2.868232531000, -3.651371295000,  2.487262933000, -0.863421200000,  0.146478331500, -0.009686855000),
+    (-2.340532183939,  7.563937897150, -9.020964992475,  5.550045133294, -1.793776917489,  0.291020480454, -0.018743169313),
+)
+
+
+# Tab 4 R182 validation rows: (row, item, expected, computed, fmt).
+# Expected values from bootstp2.xls and Clojure performance_test.clj.
+VAL_CONSTANTS = (
+    (64, "\u03c3",    0.786,    "=B39", "0.0000"),
+    (65, "\u03c1",    0.001868, "=B40", "0.000000"),
+    (66, "\u03c6",    0.7568,   "=B41", "0.0000"),
+    (67, "X",         0.2088,   "=B42", "0.0000"),
+    (68, "SDF",       0.910,    "=B44", "0.000"),
+)
+# At 60 KCAS the computed value is looked up from a performance-table
+# column (H=eta, I=Thrust, K=Dp, L=Di, M=Drag, N=ROC, P=ROS, Q=AOG)
+VAL_AT_60 = (
+    (71, "\u03b7 (eta)",  0.617,   "H", "0.000"),
+    (72, "Thrust",        453.50,  "I", "0.00"),
+    (73, "Dp",            60.95,   "K", "0.00"),
+    (74, "Di",            268.96,  "L", "0.00"),
+    (75, "Drag",          329.91,  "M", "0.00"),
+    (76, "ROC",           273.23,  "N", "0.0"),
+    (77, "ROS",           729.37,  "P", "0.0"),
+    (78, "AOG",           6.109,   "Q", "0.000"),
+)
+VAL_VSPEEDS = (
+    (81, "Vy KCAS",  77.0,  "=B55", "0.0"),
+    (82, "Vy ROC",   371.7, "=D55", "0.0"),
+    (83, "Vx KCAS",  69.5,  "=B56", "0.0"),
+    (84, "Vx AOC",   2.55,  "=D56", "0.00"),
+    (85, "Vbg KCAS", 87.0,  "=B57", "0.0"),
+    (86, "Vbg AOG",  4.74,  "=D57", "0.00"),
+    (87, "Vmd KCAS", 66.0,  "=B58", "0.0"),
+    (88, "Vmd ROS",  719.9, "=D58", "0.0"),
+    (89, "VM KCAS",  111.5, "=B59", "0.0"),
+)
+
+
 def create_tab4_performance(wb):
-    """Tab 4: Performance Calculator — full Bootstrap Method computation.
+    """Tab 4: Performance Calculator \u2014 full Bootstrap Method computation.
 
     Takes a data plate (9 aircraft params + config) and operational variables
     (W, h, N, %power), then computes a full performance table via the GAGPC
     propeller efficiency model. Pre-filled with R182 validation data.
     """
-    ws = wb.create_sheet("Performance Calculator")
-
-    # ----- Column widths -----
-    ws.column_dimensions["A"].width = 26
-    ws.column_dimensions["B"].width = 14
-    for col_letter in "CDEFGHIJKLMNOPQ":
-        ws.column_dimensions[col_letter].width = 13
+    ws, rows = new_tab(wb, "Performance Calculator",
+                       {"A": 26, "B": 14, "C:Q": 13},
+                       merges=("A1:Q1", "A2:Q2"))
 
     # Performance table geometry
     TBL_HDR = 94       # header row
@@ -603,66 +745,76 @@ def create_tab4_performance(wb):
     # =====================================================================
     # Section 1: GAGPC Polynomial Coefficients (rows 1-12)
     # =====================================================================
-    ws.merge_cells("A1:Q1")
-    style_cell(ws, 1, 1, "Performance Calculator \u2014 Bootstrap Method",
-               font=TITLE_FONT, border=False)
-    ws.merge_cells("A2:Q2")
-    style_cell(ws, 2, 1,
-               "Yellow = inputs. Blue = computed. Green = results. "
-               "Change data plate and operational variables to recompute.",
-               border=False)
-
-    style_cell(ws, 4, 1, "GAGPC Polynomial Coefficients",
-               font=SECTION_FONT, border=False)
-    style_cell(ws, 4, 6, "(8 columns \u00d7 7 coefficients \u2014 "
-               "Boeing/Uddenberg propeller data)", border=False)
-
-    # CPX breakpoints in row 5, columns C-J
-    cpx_breakpoints = [0.15, 0.25, 0.40, 0.60, 0.80, 1.00, 1.20, 1.40]
-    style_cell(ws, 5, 1, "CPX \u2192", font=BOLD)
-    for i, cpx in enumerate(cpx_breakpoints):
-        style_cell(ws, 5, 3 + i, cpx, fill=CALC_FILL, fmt="0.00")
-
-    # GAGPC coefficients: 8 columns (one per CPX) x 7 rows (c0-c6).
-    # gagpc[col_idx] = [c0, c1, ..., c6] for that CPX breakpoint.
-    gagpc = [
-        [-0.027280541925,  1.157818942224, -0.548923123013,  0.038551650269,  0.064580555280, -0.026301243311,  0.003017419881],
-        [-0.038502996895,  1.046135815788, -0.485313329667,  0.130100232509, -0.027326610124,  0.003139013961, -0.000131566345],
-        [-0.026741905000,  0.717582413500, -0.084673350000, -0.074451680000,  0.026437051000, -0.003537565000,  0.000177733000],
-        [ 0.038100252152,  0.199522455590,  0.458898025445, -0.318992736679,  0.081357821405, -0.009083801712,  0.000350613126],
-        [ 0.251897476000, -0.561665840000,  1.139055130000, -0.602193330000,  0.144341736000, -0.016194730000,  0.000664038000],
-        [ 0.140144145675,  0.071636129794, -0.057356417627,  0.276378945894, -0.159843307011,  0.034239846258, -0.002573002786],
-        [-0.705604050000,  2.868232531000, -3.651371295000,  2.487262933000, -0.863421200000,  0.146478331500, -0.009686855000],
-        [-2.340532183939,  7.563937897150, -9.020964992475,  5.550045133294, -1.793776917489,  0.291020480454, -0.018743169313],
-    ]
+    rows.append(1, [
+        make_cell(ws, "Performance Calculator \u2014 Bootstrap Method",
+                  "title"),
+    ])
+    rows.append(2, [
+        make_cell(ws,
+                  "Yellow = inputs. Blue = computed. Green = results. "
+                  "Change data plate and operational variables to recompute."),
+    ])
+
+    rows.append(4, [
+        make_cell(ws, "GAGPC Polynomial Coefficients",
+                  "section"),
+        None, None, None, None,
+        make_cell(ws, "(8 columns \u00d7 7 coefficients \u2014 "
+                  "Boeing/Uddenberg propeller data)"),
+    ])
+
+    # CPX breakpoints in row 5, columns C-J; L and M head the coefficients
+    # of the lower and upper bracket picked by B49
+    rows.append(5, [make_cell(ws, "CPX \u2192", "label"), None] + [
+        make_cell(ws, cpx, "calc", fmt="0.00") for cpx in CPX_BREAKPOINTS
+    ] + [
+        None,
+        make_cell(ws, "\u03b7_lo coeffs", "label"),
+        make_cell(ws, "\u03b7_hi coeffs", "label"),
+    ])
+
     coeff_labels = [
         ("c0", "(constant)"), ("c1", "(h)"), ("c2", "(h\u00b2)"),
         ("c3", "(h\u00b3)"), ("c4", "(h\u2074)"),
         ("c5", "(h\u2075)"), ("c6", "(h\u2076)"),
     ]
-    for ci in range(7):
-        row = 6 + ci
-        style_cell(ws, row, 1, coeff_labels[ci][0], font=BOLD)
-        style_cell(ws, row, 2, coeff_labels[ci][1])
-        for col_idx in range(8):
-            style_cell(ws, row, 3 + col_idx, gagpc[col_idx][ci],
-                       fill=CALC_FILL, fmt="0.000000000000")
+    # Row ci holds coefficient c<ci> for every CPX breakpoint, then that
+    # coefficient for the selected lower (L) and upper (M) bracket, so the
+    # performance table looks each one up once instead of once per row
+    for ci, ((name, term), coeffs) in enumerate(zip(coeff_labels, zip(*GAGPC))):
+        r = 6 + ci
+        rows.append(r, [
+            make_cell(ws, name, "label"),
+            make_cell(ws, term, "cell"),
+        ] + [
+            make_cell(ws, c, "calc", fmt="0.000000000000") for c in coeffs
+        ] + [
+            None,
+            make_cell(ws, f"=INDEX($C${r}:$J${r},1,$B$49)", "calc",
+                      fmt="0.000000000000"),
+            make_cell(ws, f"=INDEX($C${r}:$J${r},1,$B$49+1)", "calc",
+                      fmt="0.000000000000"),
+        ])
 
     # =====================================================================
     # Section 2: SDF Coefficients (rows 14-16)
     # =====================================================================
-    style_cell(ws, 14, 1, "Slow-Down Factor (SDF) Coefficients",
-               font=SECTION_FONT, border=False)
-    style_cell(ws, 14, 6, "Cubic polynomial in Z (Lowry Eq. 6.58/6.59)",
-               border=False)
-
-    style_cell(ws, 15, 1, "Tractor:", font=BOLD)
-    for i, c in enumerate([1.05263, -0.00722, -0.16462, -0.18341]):
-        style_cell(ws, 15, 2 + i, c, fill=CALC_FILL, fmt="0.00000")
-
-    style_cell(ws, 16, 1, "Pusher:", font=BOLD)
-    for i, c in enumerate([1.05263, -0.04185, -0.01481, -0.62001]):
-        style_cell(ws, 16, 2 + i, c, fill=CALC_FILL, fmt="0.00000")
+    rows.append(14, [
+        make_cell(ws, "Slow-Down Factor (SDF) Coefficients",
+                  "section"),
+        None, None, None, None,
+        make_cell(ws, "Cubic polynomial in Z (Lowry Eq. 6.58/6.59)"),
+    ])
+
+    rows.append(15, [make_cell(ws, "Tractor:", "label")] + [
+        make_cell(ws, c, "calc", fmt="0.00000")
+        for c in [1.05263, -0.00722, -0.16462, -0.18341]
+    ])
+
+    rows.append(16, [make_cell(ws, "Pusher:", "label")] + [
+        make_cell(ws, c, "calc", fmt="0.00000")
+        for c in [1.05263, -0.04185, -0.01481, -0.62001]
+    ])
 
     # =====================================================================
     # Section 3: Aircraft Data Plate + Operational Variables (rows 18-36)
@@ -670,10 +822,12 @@ def create_tab4_performance(wb):
     # Pre-filled with R182 validation data (Cessna R182 N4697K from
     # bootstp2.xls). Replace with your aircraft's values.
     # =====================================================================
-    style_cell(ws, 18, 1, "Aircraft Data Plate",
-               font=SECTION_FONT, border=False)
-    style_cell(ws, 18, 4, "(linked from Data Plate tab)",
-               border=False)
+    rows.append(18, [
+        make_cell(ws, "Aircraft Data Plate",
+                  "section"),
+        None, None,
+        make_cell(ws, "(linked from Data Plate tab)"),
+    ])
 
     # Data plate: (row, formula, label, units, fmt)
     # Each cell references the Data Plate tab directly.
@@ -695,16 +849,15 @@ def create_tab4_performance(wb):
         (30, "='Data Plate'!B16", "C (power dropoff)",          "",         "0.00"),
     ]
     for row, formula, label, units, fmt in dp_params:
-        style_cell(ws, row, 1, label, font=BOLD)
-        style_cell(ws, row, 2, formula, fill=RESULT_FILL, fmt=fmt)
-        if units:
-            style_cell(ws, row, 3, units, border=False)
+        rows.field(row, label, formula, "result", fmt=fmt, note=units or None)
 
     # Operational variables
-    style_cell(ws, 32, 1, "Operational Variables",
-               font=SECTION_FONT, border=False)
-    style_cell(ws, 32, 4, "(change these to explore different conditions)",
-               border=False)
+    rows.append(32, [
+        make_cell(ws, "Operational Variables",
+                  "section"),
+        None, None,
+        make_cell(ws, "(change these to explore different conditions)"),
+    ])
 
     # W=B33, h=B34, N=B35, %Power=B36
     ops = [
@@ -714,20 +867,17 @@ def create_tab4_performance(wb):
         (36, 0.65,   "% Power (0\u20131)", "",    "0.00"),
     ]
     for row, default, label, units, fmt in ops:
-        style_cell(ws, row, 1, label, font=BOLD)
-        style_cell(ws, row, 2, default, fill=INPUT_FILL, fmt=fmt)
-        if units:
-            style_cell(ws, row, 3, units, border=False)
+        rows.field(row, label, default, "input", fmt=fmt, note=units or None)
 
     # =====================================================================
     # Section 4: Computed Constants (rows 38-52)
     # =====================================================================
-    style_cell(ws, 38, 1, "Computed Constants",
-               font=SECTION_FONT, border=False)
+    rows.append(38, [make_cell(ws, "Computed Constants",
+                               "section")])
 
     cc = [
         (39, "\u03c3 (density ratio)",
-         "=(1-0.003566*B34/518.7)^(1/0.234957)",
+         f"=(1-0.003566*B34/518.7)^{SIGMA_EXPONENT}",
          "0.0000", "(1 - lapse\u00b7h/T\u2080)^(1/0.235)"),
         (40, "\u03c1 (slug/ft\u00b3)",
          "=0.002377*B39",
@@ -772,110 +922,99 @@ def create_tab4_performance(wb):
          "0.0000", "(CPX - CPX_lo) / (CPX_hi - CPX_lo)"),
     ]
     for row, label, formula, fmt, note in cc:
-        style_cell(ws, row, 1, label, font=BOLD)
-        style_cell(ws, row, 2, formula, fill=CALC_FILL, fmt=fmt)
-        if note:
-            style_cell(ws, row, 3, note, border=False)
+        rows.field(row, label, formula, "calc", fmt=fmt, note=note or None)
 
     # =====================================================================
     # Section 5: Optimum V-Speeds (rows 54-59)
     #
     # Performance table columns: A=KCAS, N=ROC, O=AOC, P=ROS, Q=AOG
     # =====================================================================
-    style_cell(ws, 54, 1, "Optimum V-Speeds",
-               font=SECTION_FONT, border=False)
+    rows.append(54, [make_cell(ws, "Optimum V-Speeds",
+                               "section")])
 
     ts, te = TBL_START, TBL_END
     vspeeds = [
-        # (row, label, kcas_formula, unit1, val_formula, unit2)
+        # (row, label, kcas_formula, unit1, val_formula, unit2); the
+        # extremum is taken once in column D and matched by the KCAS lookup
         (55, "Vy (best ROC):",
-         f"=INDEX(A{ts}:A{te},MATCH(MAX(N{ts}:N{te}),N{ts}:N{te},0))",
+         f"=INDEX(A{ts}:A{te},MATCH(D55,N{ts}:N{te},0))",
          "KCAS", f"=MAX(N{ts}:N{te})", "ft/min"),
         (56, "Vx (best AOC):",
-         f"=INDEX(A{ts}:A{te},MATCH(MAX(O{ts}:O{te}),O{ts}:O{te},0))",
+         f"=INDEX(A{ts}:A{te},MATCH(D56,O{ts}:O{te},0))",
          "KCAS", f"=MAX(O{ts}:O{te})", "degrees"),
         (57, "Vbg (best glide):",
-         f"=INDEX(A{ts}:A{te},MATCH(MIN(Q{ts}:Q{te}),Q{ts}:Q{te},0))",
+         f"=INDEX(A{ts}:A{te},MATCH(D57,Q{ts}:Q{te},0))",
          "KCAS", f"=MIN(Q{ts}:Q{te})", "degrees"),
         (58, "Vmd (min sink):",
-         f"=INDEX(A{ts}:A{te},MATCH(MIN(P{ts}:P{te}),P{ts}:P{te},0))",
+         f"=INDEX(A{ts}:A{te},MATCH(D58,P{ts}:P{te},0))",
          "KCAS", f"=MIN(P{ts}:P{te})", "ft/min"),
         (59, "VM (max level):",
          f'=MAXIFS(A{ts}:A{te},N{ts}:N{te},">0")',
          "KCAS", None, None),
     ]
     for row, label, kcas_f, u1, val_f, u2 in vspeeds:
-        style_cell(ws, row, 1, label, font=BOLD)
-        style_cell(ws, row, 2, kcas_f, fill=RESULT_FILL, fmt="0.0")
-        style_cell(ws, row, 3, u1, font=BOLD)
+        cells = [
+            make_cell(ws, label, "label"),
+            make_cell(ws, kcas_f, "result", fmt="0.0"),
+            make_cell(ws, u1, "label"),
+        ]
         if val_f:
-            style_cell(ws, row, 4, val_f, fill=RESULT_FILL,
-                       fmt="0.0" if "ft/min" == u2 else "0.00")
-            style_cell(ws, row, 5, u2)
+            cells += [
+                make_cell(ws, val_f, "result", fmt="0.0" if "ft/min" == u2 else "0.00"),
+                make_cell(ws, u2, "cell"),
+            ]
+        rows.append(row, cells)
 
     # =====================================================================
     # Section 6: Three-Way Validation (rows 61-91)
     #
     # Expected values from bootstp2.xls AND Clojure performance_test.clj.
     # =====================================================================
-    style_cell(ws, 61, 1,
-               "Validation: Spreadsheet vs Clojure vs bootstp2.xls",
-               font=SECTION_FONT, border=False)
-    style_cell(ws, 62, 1,
-               "R182 at W=3100, h=8000, N=2300, 65% power",
-               border=False)
+    rows.append(61, [
+        make_cell(ws, "Validation: Spreadsheet vs Clojure vs bootstp2.xls",
+                  "section"),
+    ])
+    rows.append(62, [
+        make_cell(ws, "R182 at W=3100, h=8000, N=2300, 65% power"),
+    ])
 
     # Column headers
-    for ci, hdr in enumerate(["Item", "Expected", "Computed", "Delta"], 1):
-        style_cell(ws, 63, ci, hdr, font=BOLD)
-
-    def val_row(row, name, expected, computed, fmt):
-        style_cell(ws, row, 1, name)
-        style_cell(ws, row, 2, expected, fmt=fmt)
-        style_cell(ws, row, 3, computed, fill=CALC_FILL, fmt=fmt)
-        style_cell(ws, row, 4, f"=ABS(C{row}-B{row})", fill=CALC_FILL, fmt=fmt)
+    rows.append(63, [make_cell(ws, hdr, "label")
+                     for hdr in ["Item", "Expected", "Computed", "Delta"]])
+
+    def val_rows(table):
+        for row, name, expected, computed, fmt in table:
+            rows.append(row, [
+                make_cell(ws, name, "cell"),
+                make_cell(ws, expected, "cell", fmt=fmt),
+                make_cell(ws, computed, "calc", fmt=fmt),
+                make_cell(ws, f"=ABS(C{row}-B{row})", "calc", fmt=fmt),
+            ])
 
     # Part A: Constants
-    val_row(64, "\u03c3",    0.786,    "=B39", "0.0000")
-    val_row(65, "\u03c1",    0.001868, "=B40", "0.000000")
-    val_row(66, "\u03c6",    0.7568,   "=B41", "0.0000")
-    val_row(67, "X",         0.2088,   "=B42", "0.0000")
-    val_row(68, "SDF",       0.910,    "=B44", "0.000")
+    val_rows(VAL_CONSTANTS)
 
     # Part B: Performance at 60 KCAS
-    style_cell(ws, 70, 1, "Performance at 60 KCAS",
-               font=SECTION_FONT, border=False)
-    style_cell(ws, 70, 3, "(bootstp2.xls row 101)", border=False)
-
-    # Column map: H=eta, I=Thrust, K=Dp, L=Di, M=Drag, N=ROC, P=ROS, Q=AOG
-    def idx60(col):
-        return f"=INDEX({col}{ts}:{col}{te},MATCH(60,A{ts}:A{te},0))"
-
-    val_row(71, "\u03b7 (eta)",  0.617,   idx60("H"), "0.000")
-    val_row(72, "Thrust",        453.50,  idx60("I"), "0.00")
-    val_row(73, "Dp",            60.95,   idx60("K"), "0.00")
-    val_row(74, "Di",            268.96,  idx60("L"), "0.00")
-    val_row(75, "Drag",          329.91,  idx60("M"), "0.00")
-    val_row(76, "ROC",           273.23,  idx60("N"), "0.0")
-    val_row(77, "ROS",           729.37,  idx60("P"), "0.0")
-    val_row(78, "AOG",           6.109,   idx60("Q"), "0.000")
+    rows.append(70, [
+        make_cell(ws, "Performance at 60 KCAS",
+                  "section"),
+        None,
+        make_cell(ws, "(bootstp2.xls row 101)"),
+    ])
+    val_rows(
+        (row, name, expected,
+         f"=INDEX({col}{ts}:{col}{te},MATCH(60,A{ts}:A{te},0))", fmt)
+        for row, name, expected, col, fmt in VAL_AT_60
+    )
 
     # Part C: V-Speed comparison
-    style_cell(ws, 80, 1, "V-Speed Comparison",
-               font=SECTION_FONT, border=False)
-    val_row(81, "Vy KCAS",  77.0,  "=B55", "0.0")
-    val_row(82, "Vy ROC",   371.7, "=D55", "0.0")
-    val_row(83, "Vx KCAS",  69.5,  "=B56", "0.0")
-    val_row(84, "Vx AOC",   2.55,  "=D56", "0.00")
-    val_row(85, "Vbg KCAS", 87.0,  "=B57", "0.0")
-    val_row(86, "Vbg AOG",  4.74,  "=D57", "0.00")
-    val_row(87, "Vmd KCAS", 66.0,  "=B58", "0.0")
-    val_row(88, "Vmd ROS",  719.9, "=D58", "0.0")
-    val_row(89, "VM KCAS",  111.5, "=B59", "0.0")
-
-    style_cell(ws, 91, 1,
-               "Deltas < 0.5 for KCAS (0.5 kt resolution), < 1% for others",
-               border=False)
+    rows.append(80, [make_cell(ws, "V-Speed Comparison",
+                               "section")])
+    val_rows(VAL_VSPEEDS)
+
+    rows.append(91, [
+        make_cell(ws, "Deltas < 0.5 for KCAS (0.5 kt resolution), < 1% for others"),
+    ])
 
     # =====================================================================
     # Section 7: Performance Table (rows 93-255)
@@ -884,11 +1023,12 @@ def create_tab4_performance(wb):
     #          H=eta, I=Thrust, J=q, K=Dp, L=Di, M=Drag,
     #          N=ROC, O=AOC, P=ROS, Q=AOG
     # =====================================================================
-    style_cell(ws, 93, 1, "Performance Table",
-               font=SECTION_FONT, border=False)
-    style_cell(ws, 93, 5,
-               "KCAS 60\u2013140 (step 0.5) at current conditions",
-               border=False)
+    rows.append(93, [
+        make_cell(ws, "Performance Table",
+                  "section"),
+        None, None, None,
+        make_cell(ws, "KCAS 60\u2013140 (step 0.5) at current conditions"),
+    ])
 
     headers = [
         "KCAS", "KTAS", "V_fps", "J", "h",
@@ -896,8 +1036,7 @@ def create_tab4_performance(wb):
         "Thrust", "q", "Dp", "Di", "Drag",
         "ROC", "AOC", "ROS", "AOG",
     ]
-    for i, hdr in enumerate(headers):
-        style_cell(ws, TBL_HDR, 1 + i, hdr, font=BOLD)
+    rows.append(TBL_HDR, [make_cell(ws, hdr, "label") for hdr in headers])
 
     # Column format map (1-indexed column to number format)
     col_fmts = {
@@ -921,57 +1060,55 @@ def create_tab4_performance(wb):
     }
 
     # --- Helper: Horner polynomial formula for GAGPC ---
-    def horner(row, idx_offset):
+    def horner(row, col):
         """Build Horner's method formula for GAGPC polynomial evaluation.
 
-        GAGPC coefficients: $C$6:$J$12 (c0 in row 6, c6 in row 12).
-        Bracket index: $B$49 (from MATCH on CPX breakpoints).
+        Selected bracket coefficients: column col (L = lower, M = upper),
+        c0 in row 6 through c6 in row 12.
         h (speed-power coefficient): column E of the given row.
 
         Horner form: c0 + h*(c1 + h*(c2 + h*(c3 + h*(c4 + h*(c5 + h*c6)))))
         """
         h = f"E{row}"
-        idx = "$B$49" if idx_offset == 0 else "$B$49+1"
 
         # Build from c6 (row 12) inward to c1 (row 7)
-        result = f"INDEX($C$12:$J$12,1,{idx})"  # c6
+        result = f"${col}$12"  # c6
         for cr in range(11, 6, -1):  # c5 (row 11) down to c1 (row 7)
-            result = f"INDEX($C${cr}:$J${cr},1,{idx})+{h}*({result})"
+            result = f"${col}${cr}+{h}*({result})"
         # Final outer wrap: c0 (row 6) + h*(c1 + ...)
-        result = f"INDEX($C$6:$J$6,1,{idx})+{h}*({result})"
+        result = f"${col}$6+{h}*({result})"
         return f"={result}"
 
+    # Formula templates per column after KCAS, built once with an {r}
+    # placeholder for the data row and filled in with str.format per row
+    perf_formulas = (
+        "=A{r}/SQRT($B$39)",                          # KTAS
+        "=B{r}/0.5924838",                            # V_fps
+        "=C{r}/($B$46*$B$23)",                        # J
+        "=D{r}/$B$47^(1/3)",                          # h
+        horner("{r}", "L"),                           # eta_lo
+        horner("{r}", "M"),                           # eta_hi
+        "=$B$44*(F{r}+$B$52*(G{r}-F{r}))",            # eta
+        "=H{r}*$B$45/C{r}",                           # Thrust
+        "=0.5*$B$40*C{r}^2",                          # q
+        "=$B$24*J{r}*$B$19",                          # Dp
+        "=$B$33^2/(J{r}*$B$19*PI()*$B$43*$B$25)",     # Di
+        "=K{r}+L{r}",                                 # Drag
+        "=(I{r}-M{r})*C{r}/$B$33*60",                 # ROC
+        "=DEGREES(ASIN(MIN(1,MAX(-1,(I{r}-M{r})/$B$33))))",  # AOC
+        "=M{r}*C{r}/$B$33*60",                        # ROS
+        "=DEGREES(ASIN(MIN(1,MAX(-1,M{r}/$B$33))))",  # AOG
+    )
+    styles = ["cell"] + ["calc"] * len(perf_formulas)
+    fmts = [col_fmts[col] for col in range(1, 18)]
+
     # --- Generate 161 data rows ---
     for i in range(161):
         row = TBL_START + i
         kcas = 60.0 + i * 0.5
-
-        formulas = {
-            1: kcas,                                            # KCAS
-            2: f"=A{row}/SQRT($B$39)",                         # KTAS
-            3: f"=B{row}/0.5924838",                           # V_fps
-            4: f"=C{row}/($B$46*$B$23)",                       # J
-            5: f"=D{row}/$B$47^(1/3)",                         # h
-            6: horner(row, 0),                                  # eta_lo
-            7: horner(row, 1),                                  # eta_hi
-            8: f"=$B$44*(F{row}+$B$52*(G{row}-F{row}))",       # eta
-            9: f"=H{row}*$B$45/C{row}",                        # Thrust
-            10: f"=0.5*$B$40*C{row}^2",                        # q
-            11: f"=$B$24*J{row}*$B$19",                         # Dp
-            12: f"=$B$33^2/(J{row}*$B$19*PI()*$B$43*$B$25)",   # Di
-            13: f"=K{row}+L{row}",                              # Drag
-            14: f"=(I{row}-M{row})*C{row}/$B$33*60",           # ROC
-            15: f"=DEGREES(ASIN(MIN(1,MAX(-1,"                  # AOC
-                f"(I{row}-M{row})/$B$33))))",
-            16: f"=M{row}*C{row}/$B$33*60",                    # ROS
-            17: f"=DEGREES(ASIN(MIN(1,MAX(-1,"                  # AOG
-                f"M{row}/$B$33))))",
-        }
-
-        for col in range(1, 18):
-            val = formulas[col]
-            fill = None if col == 1 else CALC_FILL
-            style_cell(ws, row, col, val, fill=fill, fmt=col_fmts[col])
+        values = [kcas] + [t.format(r=row) for t in perf_formulas]
+        rows.append(row, [make_cell(ws, value, style, fmt=fmt)
+                          for value, style, fmt in zip(values, styles, fmts)])
 
     # =====================================================================
     # Section 8: Charts (after the performance table)
@@ -988,9 +1125,11 @@ def create_tab4_performance(wb):
     chart1.height = 14
     chart1.style = 2
 
-    x_data = Reference(ws, min_col=1, min_row=TBL_START, max_row=TBL_END)
-    thrust_ref = Reference(ws, min_col=9, min_row=TBL_START, max_row=TBL_END)
-    drag_ref = Reference(ws, min_col=13, min_row=TBL_START, max_row=TBL_END)
+    # One KCAS x-reference shared by every series on both charts
+    tbl_rows = (TBL_START, TBL_END)
+    x_data = col_ref(ws, 1, tbl_rows)        # KCAS (col A)
+    thrust_ref = col_ref(ws, 9, tbl_rows)    # Thrust (col I)
+    drag_ref = col_ref(ws, 13, tbl_rows)     # Drag (col M)
 
     s_thrust = Series(thrust_ref, x_data, title="Thrust")
     s_drag = Series(drag_ref, x_data, title="Drag")
@@ -1007,7 +1146,7 @@ def create_tab4_performance(wb):
     chart2.height = 14
     chart2.style = 2
 
-    roc_ref = Reference(ws, min_col=14, min_row=TBL_START, max_row=TBL_END)
+    roc_ref = col_ref(ws, 14, tbl_rows)      # ROC (col N)
     s_roc = Series(roc_ref, x_data, title="ROC")
     chart2.series.append(s_roc)
     ws.add_chart(chart2, f"J{chart_row}")
@@ -1015,41 +1154,43 @@ def create_tab4_performance(wb):
 
 def create_tab0_instructions(wb):
     """Tab 0: Instructions — overview of the Bootstrap Method and workflow."""
-    ws = wb.create_sheet("Instructions", 0)
-
-    ws.column_dimensions["A"].width = 100
+    ws, rows = new_tab(wb, "Instructions", {"A": 100}, index=0)
     ws.sheet_properties.tabColor = "2F5496"
 
     r = 1
-    style_cell(ws, r, 1,
-               "Bootstrap Method — Aircraft Performance Calculator",
-               font=TITLE_FONT, border=False)
+    rows.append(r, [
+        make_cell(ws, "Bootstrap Method — Aircraft Performance Calculator",
+                  "title"),
+    ])
 
     r = 3
-    style_cell(ws, r, 1, "What is the Bootstrap Method?",
-               font=SECTION_FONT, border=False)
+    rows.append(r, [make_cell(ws, "What is the Bootstrap Method?",
+                              "section")])
     r = 4
-    ws.cell(row=r, column=1).value = (
-        "The Bootstrap Method is an aircraft performance prediction technique for "
-        "constant-speed propeller airplanes, developed by John T. Lowry in "
-        "Performance of Light Aircraft (AIAA, 1999). It derives a complete performance "
-        "envelope — thrust, drag, climb, glide, and optimum V-speeds — from a small set "
-        "of flight-test-derived parameters called the 'bootstrap data plate.'")
-    ws.cell(row=r, column=1).alignment = Alignment(wrap_text=True)
     ws.row_dimensions[r].height = 60
+    rows.append(r, [
+        make_cell(ws,
+                  "The Bootstrap Method is an aircraft performance prediction technique for "
+                  "constant-speed propeller airplanes, developed by John T. Lowry in "
+                  "Performance of Light Aircraft (AIAA, 1999). It derives a complete performance "
+                  "envelope — thrust, drag, climb, glide, and optimum V-speeds — from a small set "
+                  "of flight-test-derived parameters called the 'bootstrap data plate.'",
+                  "prose"),
+    ])
 
     r = 6
-    ws.cell(row=r, column=1).value = (
-        "IMPORTANT: This spreadsheet implements the constant-speed propeller version "
-        "of the Bootstrap Method using the Boeing/Uddenberg GAGPC propeller efficiency "
-        "model. It is NOT suitable for fixed-pitch propeller aircraft, which require a "
-        "different propeller model (see Lowry Ch. 5 or the AvWeb Part 1 article below).")
-    ws.cell(row=r, column=1).font = Font(bold=True, color="CC0000")
-    ws.cell(row=r, column=1).alignment = Alignment(wrap_text=True)
     ws.row_dimensions[r].height = 50
+    rows.append(r, [
+        make_cell(ws,
+                  "IMPORTANT: This spreadsheet implements the constant-speed propeller version "
+                  "of the Bootstrap Method using the Boeing/Uddenberg GAGPC propeller efficiency "
+                  "model. It is NOT suitable for fixed-pitch propeller aircraft, which require a "
+                  "different propeller model (see Lowry Ch. 5 or the AvWeb Part 1 article below).",
+                  "warning"),
+    ])
 
     r = 8
-    style_cell(ws, r, 1, "Workflow", font=SECTION_FONT, border=False)
+    rows.append(r, [make_cell(ws, "Workflow", "section")])
     steps = [
         ("Step 1: Measure your propeller (Tab: Prop Blade → TAF)",
          "Use calipers to measure blade width at 17 standard stations along "
@@ -1077,19 +1218,18 @@ def create_tab0_instructions(wb):
 
     for title, desc in steps:
         r += 1
-        ws.cell(row=r, column=1).value = title
-        ws.cell(row=r, column=1).font = Font(bold=True, size=11)
+        rows.append(r, [make_cell(ws, title, "step")])
         r += 1
-        ws.cell(row=r, column=1).value = desc
-        ws.cell(row=r, column=1).alignment = Alignment(wrap_text=True)
         ws.row_dimensions[r].height = 55
+        rows.append(r, [make_cell(ws, desc, "prose")])
         r += 1  # blank row
 
     r += 1
-    style_cell(ws, r, 1, "V-Speeds", font=SECTION_FONT, border=False)
+    rows.append(r, [make_cell(ws, "V-Speeds", "section")])
     r += 1
-    ws.cell(row=r, column=1).value = (
-        "The calculator finds five optimum speeds from the performance table:")
+    rows.append(r, [
+        make_cell(ws, "The calculator finds five optimum speeds from the performance table:"),
+    ])
     vspeeds = [
         "Vy — Best Rate of Climb: maximum altitude gain per minute. Use for normal climbs.",
         "Vx — Best Angle of Climb: steepest climb gradient. Use for obstacle clearance.",
@@ -1101,12 +1241,11 @@ def create_tab0_instructions(wb):
     ]
     for v in vspeeds:
         r += 1
-        ws.cell(row=r, column=1).value = f"  • {v}"
-        ws.cell(row=r, column=1).alignment = Alignment(wrap_text=True)
         ws.row_dimensions[r].height = 30
+        rows.append(r, [make_cell(ws, f"  • {v}", "prose")])
 
     r += 2
-    style_cell(ws, r, 1, "References", font=SECTION_FONT, border=False)
+    rows.append(r, [make_cell(ws, "References", "section")])
     BOOK_URL = ("https://github.com/mentat-collective/BootstrapMethod/"
                 "blob/main/PerfOfLightAircraft.pdf")
     AVWEB_1 = ("https://avweb.com/features_old/the-bootstrap-approach-to-aircraft-"
@@ -1125,37 +1264,62 @@ def create_tab0_instructions(wb):
     ]
     for text, url in refs:
         r += 1
-        cell = ws.cell(row=r, column=1, value=text)
-        cell.alignment = Alignment(wrap_text=True)
+        cell = make_cell(ws, text, "link" if url else "prose")
         if url:
             cell.hyperlink = url
-            cell.font = Font(color="0563C1", underline="single")
         ws.row_dimensions[r].height = 30
+        rows.append(r, [cell])
 
     r += 2
-    style_cell(ws, r, 1, "Color Key", font=SECTION_FONT, border=False)
+    rows.append(r, [make_cell(ws, "Color Key", "section")])
     r += 1
-    style_cell(ws, r, 1, "Yellow cells = your inputs (replace with your values)",
-               fill=INPUT_FILL)
+    rows.append(r, [make_cell(ws, "Yellow cells = your inputs (replace with your values)",
+                              "input")])
     r += 1
-    style_cell(ws, r, 1, "Blue cells = computed values (do not edit)",
-               fill=CALC_FILL)
+    rows.append(r, [make_cell(ws, "Blue cells = computed values (do not edit)",
+                              "calc")])
     r += 1
-    style_cell(ws, r, 1, "Green cells = key results or cross-tab links",
-               fill=RESULT_FILL)
+    rows.append(r, [make_cell(ws, "Green cells = key results or cross-tab links",
+                              "result")])
 
 
-def main():
-    wb = openpyxl.Workbook()
+# Deflate level for the saved .xlsx. openpyxl's wb.save() always uses zlib's
+# default (6); the sheet XML here is small, so the fastest level costs little.
+ZIP_COMPRESSLEVEL = 1
+
+
+def build_workbook():
+    """Build the full write-only workbook, ready to save."""
+    wb = openpyxl.Workbook(write_only=True)
+    register_styles(wb)
     create_tab1_propeller(wb)
     create_tab2_flight_tests(wb)
     create_tab3_data_plate(wb)
     create_tab4_performance(wb)
     create_tab0_instructions(wb)
+    return wb
+
+
+def save_workbook(wb, filename, compress=True, compresslevel=ZIP_COMPRESSLEVEL):
+    """Save wb like wb.save(filename), but with the given deflate level.
+
+    compress=False stores the parts uncompressed, which is quicker for
+    throwaway regenerations at the cost of a much larger file.
+    """
+    if compress:
+        archive = ZipFile(filename, "w", ZIP_DEFLATED, allowZip64=True,
+                          compresslevel=compresslevel)
+    else:
+        archive = ZipFile(filename, "w", ZIP_STORED, allowZip64=True)
+    ExcelWriter(wb, archive).save()  # closes the archive
+
+
+def main():
+    wb = build_workbook()
 
     import os
     out = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bootstrap_method.xlsx")
-    wb.save(out)
+    save_workbook(wb, out)
     print(f"Saved: {out}")
     print("Upload this file to Google Sheets.")
 
@@ -5,12 +5,15 @@ Run with: uv run python test_sheet.py
 """
 
 import os
-import subprocess
 import sys
+import traceback
 import openpyxl
 
+import create_sheet
+
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
 XLSX = os.path.join(PROJECT_DIR, "bootstrap_method.xlsx")
+CREATE_SHEET = os.path.join(PROJECT_DIR, "create_sheet.py")
 
 passed = 0
 failed = 0
@@ -28,16 +31,21 @@ def check(name, condition, detail=""):
         print(msg)
 
 
+def is_stale():
+    """True if the xlsx is missing or older than create_sheet.py."""
+    return (not os.path.exists(XLSX)
+            or os.path.getmtime(XLSX) < os.path.getmtime(CREATE_SHEET))
+
+
 def main():
-    # Regenerate the spreadsheet
-    result = subprocess.run(
-        ["uv", "run", "python", "create_sheet.py"],
-        capture_output=True, text=True,
-        cwd=PROJECT_DIR,
-    )
-    if result.returncode != 0:
-        print(f"create_sheet.py failed:\n{result.stderr}")
-        sys.exit(1)
+    # Regenerate the spreadsheet unless it is newer than its generator
+    # (in-process, so there is no second interpreter or uv start-up)
+    if is_stale():
+        try:
+            create_sheet.save_workbook(create_sheet.build_workbook(), XLSX)
+        except Exception:
+            print(f"create_sheet.py failed:\n{traceback.format_exc()}")
+            sys.exit(1)
 
     wb = openpyxl.load_workbook(XLSX)
 
@@ -155,6 +163,17 @@ def main():
           isinstance(ktas_95, str) and "B$39" in ktas_95,
           f"got {ktas_95!r}")
 
+    # eta_lo/eta_hi use the bracket coefficients selected once in L6:M12
+    for cell_ref, col in [("F95", "L"), ("G95", "M")]:
+        eta = pc[cell_ref].value
+        check(f"{cell_ref} (eta) uses {col}6:{col}12 without INDEX",
+              isinstance(eta, str) and f"{col}$6" in eta and f"{col}$12" in eta
+              and "INDEX" not in eta,
+              f"got {eta!r}")
+    check("L6 selects c0 of the lower bracket",
+          pc["L6"].value == "=INDEX($C$6:$J$6,1,$B$49)",
+          f"got {pc['L6'].value!r}")
+
     # Dp formula references B24 (CD0) and B19 (S) — may be $B$24
     dp_95 = pc["K95"].value
     check("K95 (Dp) references B24 and B19",